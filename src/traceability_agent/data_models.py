@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
 
 
 @dataclass(slots=True)
@@ -14,7 +14,7 @@ class RawProblem:
     text: str
     stakeholder: Optional[str] = None
     theme: Optional[str] = None
-    metadata: Dict[str, str] = field(default_factory=dict)
+    metadata: Optional[Dict[str, str]] = None
 
 
 @dataclass(slots=True)
@@ -24,7 +24,7 @@ class RawStory:
     story_id: str
     text: str
     rationale: Optional[str] = None
-    metadata: Dict[str, str] = field(default_factory=dict)
+    metadata: Optional[Dict[str, str]] = None
 
 
 @dataclass(slots=True)
@@ -42,7 +42,14 @@ class NormalisedProblem:
     evidence_strength: int
     stakeholder: Optional[str] = None
     theme: Optional[str] = None
-    metadata: Dict[str, str] = field(default_factory=dict)
+    metadata: Optional[Dict[str, str]] = None
+    persona_tokens: Optional[Set[str]] = None
+    capability_terms: Optional[Set[str]] = None
+    barrier_terms: Optional[Set[str]] = None
+    value_terms: Optional[Set[str]] = None
+    governance_terms: Optional[Set[str]] = None
+    barrier_lower: Optional[str] = None
+    domain_terms_set: Optional[frozenset] = None
 
     @property
     def canonical_statement(self) -> str:
@@ -63,7 +70,39 @@ class ParsedStory:
     business_value: str
     domain_terms: List[str]
     governance_signal: int
-    metadata: Dict[str, str] = field(default_factory=dict)
+    metadata: Optional[Dict[str, str]] = None
+    persona_tokens: Optional[Set[str]] = None
+    capability_terms: Optional[Set[str]] = None
+    value_terms: Optional[Set[str]] = None
+    raw_terms: Optional[Set[str]] = None
+    raw_text_lower: Optional[str] = None
+    domain_terms_set: Optional[frozenset] = None
+
+
+FACET_FIELDS = (
+    "persona",
+    "capability",
+    "causal_root",
+    "value",
+    "governance",
+    "granularity_compatible",
+)
+
+FACET_BITS = {name: 1 << bit for bit, name in enumerate(FACET_FIELDS)}
+
+class FacetScores(NamedTuple):
+    """The seven rubric facet scores for one problem/story pair."""
+
+    persona_alignment: int
+    capability_alignment: int
+    causal_coverage: int
+    granularity_fit: int
+    value_alignment: int
+    governance_alignment: int
+    evidence_strength_transfer: int
+
+
+SCORE_FIELDS = FacetScores._fields
 
 
 @dataclass(slots=True)
@@ -72,15 +111,27 @@ class ScoredEdge:
 
     problem_id: str
     story_id: str
-    scores: Dict[str, int]
+    scores: FacetScores
     total_score: int
     confidence_band: str
-    facet_coverage: Dict[str, bool]
+    facet_coverage: int
     coverage_label: str
     causal_rationale: str
-    provenance: Dict[str, object]
+    provenance: Mapping[str, object]
     flags: List[str] = field(default_factory=list)
 
+    @property
+    def scores_dict(self) -> Dict[str, int]:
+        """Materialise the string-keyed view of the score tuple."""
+
+        return dict(zip(SCORE_FIELDS, self.scores))
+
+    @property
+    def facet_coverage_dict(self) -> Dict[str, bool]:
+        """Materialise the name-keyed view of the facet bitmask."""
+
+        return {name: bool(self.facet_coverage >> bit & 1) for bit, name in enumerate(FACET_FIELDS)}
+
 
 @dataclass(slots=True)
 class CoverageSummary:
@@ -97,14 +148,4 @@ class CoverageSummary:
 def iter_domain_terms(terms: Iterable[str]) -> List[str]:
     """Return a de-duplicated list of domain terms preserving order."""
 
-    seen = set()
-    ordered: List[str] = []
-    for term in terms:
-        normalised = term.strip().lower()
-        if not normalised:
-            continue
-        if normalised in seen:
-            continue
-        ordered.append(normalised)
-        seen.add(normalised)
-    return ordered
+    return list(dict.fromkeys(term for raw in terms if (term := raw.strip().lower())))
@@ -4,30 +4,174 @@ from __future__ import annotations
 
 import csv
 import json
+import mmap
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
-from .data_models import NormalisedProblem, ParsedStory, RawProblem, RawStory, ScoredEdge
+from .data_models import (
+    FACET_FIELDS,
+    CoverageSummary,
+    NormalisedProblem,
+    ParsedStory,
+    RawProblem,
+    RawStory,
+    ScoredEdge,
+)
 from .normalisation import normalise_problems
-from .pairing import AgentConfig, coverage_summaries, propose_pairs, score_pairs
+from .pairing import AgentConfig, coverage_summaries, pair_and_score
 from .story_parser import parse_stories
 
+try:  # pragma: no cover - optional acceleration
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - stdlib fallback is always available
+    pa = None
+    pa_csv = None
 
-PROBLEM_FIELDNAMES = ["problem_id", "text", "stakeholder", "theme"]
-STORY_FIELDNAMES = ["story_id", "text", "rationale"]
+try:  # pragma: no cover - optional acceleration
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback is always available
+    orjson = None
+
+
+def _json_loads(data: str | bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _json_dumps_sorted(obj: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(obj, sort_keys=True)
+
+
+@lru_cache(maxsize=256)
+def _facet_flags_json(mask: int) -> str:
+    """Serialise a facet bitmask once; only 64 combinations exist."""
+
+    return _json_dumps_sorted(
+        {name: bool(mask >> bit & 1) for bit, name in enumerate(FACET_FIELDS)}
+    )
+
+
+PROBLEM_FIELDNAMES = frozenset({"problem_id", "text", "stakeholder", "theme"})
+STORY_FIELDNAMES = frozenset({"story_id", "text", "rationale"})
+
+
+def _read_csv_rows(file_path: Path) -> List[dict]:
+    """Read a CSV into per-row dicts of strings, using pyarrow when available."""
+
+    if pa_csv is not None:
+        table = pa_csv.read_csv(
+            file_path, read_options=pa_csv.ReadOptions(block_size=1 << 20)
+        )
+        columns = {
+            name: [_as_cell(value) for value in column]
+            for name, column in zip(table.column_names, table.to_pydict().values())
+        }
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+    text = file_path.read_text("utf-8")
+    rows = _split_csv_fast(text)
+    if rows is not None:
+        return rows
+    with file_path.open("r", encoding="utf-8") as handle:
+        return list(csv.DictReader(handle))
+
+
+def _split_csv_fast(text: str) -> List[dict] | None:
+    """Tokenise a well-formed CSV with str.split, or return None when unsafe.
+
+    Only applies when no quoting is present and every line has the same column
+    count, which covers the files this pipeline emits itself.
+    """
+
+    if '"' in text:
+        return None
+    lines = text.splitlines()
+    if not lines:
+        return []
+    header = lines[0].split(",")
+    width = len(header)
+    rows: List[dict] = []
+    for line in lines[1:]:
+        if not line:
+            continue
+        values = line.split(",")
+        if len(values) != width:
+            return None
+        rows.append(dict(zip(header, values)))
+    return rows
+
+
+def _resolve_key(names: Iterable[str], *aliases: str) -> str | None:
+    """Return the first alias present in the header, resolved once per file."""
+
+    for alias in aliases:
+        if alias in names:
+            return alias
+    return None
+
+
+def _as_cell(value: object) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _write_csv_rows(path: Path, fieldnames: List[str], rows: Iterable[tuple]) -> None:
+    """Write rows (tuples in ``fieldnames`` order), using pyarrow when available."""
+
+    if pa_csv is not None:
+        materialised = list(rows)
+        columns = {
+            name: list(values)
+            for name, values in zip(
+                fieldnames, zip(*materialised) if materialised else [[]] * len(fieldnames)
+            )
+        }
+        pa_csv.write_csv(
+            pa.table(columns),
+            path,
+            write_options=pa_csv.WriteOptions(batch_size=8192),
+        )
+        return
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
+
+
+def read_json_any(path: Path) -> List[dict]:
+    """Load JSON records from one buffer, sniffing array vs line-delimited.
+
+    The file is read as bytes exactly once; the first non-whitespace byte
+    decides whether the buffer is a JSON array or JSONL, so the suffix does
+    not matter and no second pass over the file is needed.
+    """
+
+    data = path.read_bytes()
+    head = data.lstrip()
+    if not head:
+        return []
+    if head[:1] == b"[":
+        return _json_loads(data)
+    return [_json_loads(line) for line in data.split(b"\n") if line.strip()]
 
 
 def read_json_lines(path: Path) -> List[dict]:
-    records: List[dict] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            records.append(json.loads(line))
-    return records
+    """Parse a JSONL file; kept as an alias of the sniffing reader."""
+
+    return read_json_any(path)
 
 
 def load_problems(path: str | os.PathLike[str]) -> List[RawProblem]:
@@ -36,20 +180,26 @@ def load_problems(path: str | os.PathLike[str]) -> List[RawProblem]:
         raise FileNotFoundError(file_path)
     problems: List[RawProblem] = []
     if file_path.suffix.lower() == ".csv":
-        with file_path.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                problems.append(
-                    RawProblem(
-                        problem_id=row.get("problem_id") or row.get("PR_ID") or row.get("id") or str(len(problems) + 1),
-                        text=row.get("text") or row.get("problem_text") or "",
-                        stakeholder=row.get("stakeholder") or row.get("persona"),
-                        theme=row.get("theme"),
-                        metadata={key: value for key, value in row.items() if key not in PROBLEM_FIELDNAMES},
-                    )
+        rows = _read_csv_rows(file_path)
+        names = list(rows[0]) if rows else []
+        pid_key = _resolve_key(names, "problem_id", "PR_ID", "id")
+        text_key = _resolve_key(names, "text", "problem_text")
+        stakeholder_key = _resolve_key(names, "stakeholder", "persona")
+        theme_key = _resolve_key(names, "theme")
+        meta_keys = [name for name in names if name not in PROBLEM_FIELDNAMES]
+        problems_append = problems.append
+        for row in rows:
+            problems_append(
+                RawProblem(
+                    problem_id=(row[pid_key] if pid_key else "") or str(len(problems) + 1),
+                    text=row[text_key] if text_key else "",
+                    stakeholder=row[stakeholder_key] if stakeholder_key else None,
+                    theme=row[theme_key] if theme_key else None,
+                    metadata={key: row[key] for key in meta_keys} if meta_keys else None,
                 )
+            )
     elif file_path.suffix.lower() in {".json", ".jsonl"}:
-        records = read_json_lines(file_path) if file_path.suffix.lower() == ".jsonl" else json.loads(file_path.read_text("utf-8"))
+        records = read_json_any(file_path)
         for record in records:
             problems.append(
                 RawProblem(
@@ -57,7 +207,7 @@ def load_problems(path: str | os.PathLike[str]) -> List[RawProblem]:
                     text=record.get("text") or record.get("problem_text") or "",
                     stakeholder=record.get("stakeholder"),
                     theme=record.get("theme"),
-                    metadata={key: value for key, value in record.items() if key not in PROBLEM_FIELDNAMES},
+                    metadata={key: value for key, value in record.items() if key not in PROBLEM_FIELDNAMES} or None,
                 )
             )
     else:
@@ -65,8 +215,14 @@ def load_problems(path: str | os.PathLike[str]) -> List[RawProblem]:
     return problems
 
 
-STORY_HEADING_RE = re.compile(r"^#### (?P<id>[A-Za-z0-9\-]+): (?P<title>.+)$")
-STORY_BULLET_RE = re.compile(r"^- As an? .+$", re.IGNORECASE)
+STORY_LINE_RE = re.compile(
+    r"^(?:#### (?P<id>[A-Za-z0-9\-]+): (?P<title>.+)"
+    r"|- (?P<bullet>As an? .+)"
+    r"|- (?P<acceptance>Acceptance Criteria.*)"
+    r"|- (?P<listitem>.+)"
+    r"|  - (?P<rationale>.+))$",
+    re.IGNORECASE,
+)
 
 
 def parse_story_blocks(lines: Iterable[str]) -> List[RawStory]:
@@ -75,35 +231,39 @@ def parse_story_blocks(lines: Iterable[str]) -> List[RawStory]:
     current_text: List[str] = []
     current_rationale: List[str] = []
     in_story = False
+    match_line = STORY_LINE_RE.match
+    stories_append = stories.append
     for line in lines:
         stripped = line.strip()
-        heading = STORY_HEADING_RE.match(stripped)
-        if heading:
+        match = match_line(stripped)
+        if match is None:
+            continue
+        group = match.lastgroup
+        if group == "bullet":
+            in_story = True
+            current_text.append(match["bullet"])
+        elif group in ("listitem", "acceptance"):
+            # Mid-story list items (acceptance criteria included) extend the
+            # story text; outside a story the acceptance marker just resets.
+            if in_story:
+                current_text.append(match[group])
+            else:
+                in_story = False
+        elif group == "rationale":
+            current_rationale.append(match["rationale"])
+        else:
             if current_id and current_text:
-                stories.append(
+                stories_append(
                     RawStory(
                         story_id=current_id,
                         text=" ".join(current_text).strip(),
                         rationale="\n".join(current_rationale).strip() or None,
                     )
                 )
-            current_id = heading.group("id")
+            current_id = match.group("id")
             current_text = []
             current_rationale = []
             in_story = False
-            continue
-        if STORY_BULLET_RE.match(stripped):
-            in_story = True
-            current_text.append(stripped.lstrip("- "))
-            continue
-        if stripped.startswith("- ") and in_story:
-            current_text.append(stripped.lstrip("- "))
-            continue
-        if stripped.startswith("- Acceptance Criteria"):
-            in_story = False
-            continue
-        if stripped.startswith("  - "):
-            current_rationale.append(stripped.lstrip("- "))
     if current_id and current_text:
         stories.append(
             RawStory(
@@ -115,29 +275,52 @@ def parse_story_blocks(lines: Iterable[str]) -> List[RawStory]:
     return stories
 
 
+
+def _iter_text_lines(file_path: Path) -> Iterator[str]:
+    """Yield decoded lines from an mmap view without copying the whole file."""
+
+    if file_path.stat().st_size == 0:
+        return
+    with file_path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            size = len(mm)
+            while start < size:
+                newline = mm.find(b"\n", start)
+                if newline == -1:
+                    yield mm[start:].decode("utf-8")
+                    break
+                yield mm[start:newline].decode("utf-8")
+                start = newline + 1
+
+
 def load_stories(path: str | os.PathLike[str]) -> List[RawStory]:
     file_path = Path(path)
     if not file_path.exists():
         raise FileNotFoundError(file_path)
     if file_path.suffix.lower() in {".md", ".txt"}:
-        lines = file_path.read_text("utf-8").splitlines()
-        return parse_story_blocks(lines)
+        return parse_story_blocks(_iter_text_lines(file_path))
     if file_path.suffix.lower() == ".csv":
         stories: List[RawStory] = []
-        with file_path.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                stories.append(
-                    RawStory(
-                        story_id=row.get("story_id") or row.get("BR_ID") or row.get("id") or str(len(stories) + 1),
-                        text=row.get("text") or row.get("story_text") or "",
-                        rationale=row.get("rationale"),
-                        metadata={key: value for key, value in row.items() if key not in STORY_FIELDNAMES},
-                    )
+        rows = _read_csv_rows(file_path)
+        names = list(rows[0]) if rows else []
+        sid_key = _resolve_key(names, "story_id", "BR_ID", "id")
+        text_key = _resolve_key(names, "text", "story_text")
+        rationale_key = _resolve_key(names, "rationale")
+        meta_keys = [name for name in names if name not in STORY_FIELDNAMES]
+        stories_append = stories.append
+        for row in rows:
+            stories_append(
+                RawStory(
+                    story_id=(row[sid_key] if sid_key else "") or str(len(stories) + 1),
+                    text=row[text_key] if text_key else "",
+                    rationale=row[rationale_key] if rationale_key else None,
+                    metadata={key: row[key] for key in meta_keys} if meta_keys else None,
                 )
+            )
         return stories
     if file_path.suffix.lower() in {".json", ".jsonl"}:
-        records = read_json_lines(file_path) if file_path.suffix.lower() == ".jsonl" else json.loads(file_path.read_text("utf-8"))
+        records = read_json_any(file_path)
         stories = []
         for record in records:
             stories.append(
@@ -145,147 +328,311 @@ def load_stories(path: str | os.PathLike[str]) -> List[RawStory]:
                     story_id=str(record.get("story_id") or record.get("id")),
                     text=record.get("text") or record.get("story") or "",
                     rationale=record.get("rationale"),
-                    metadata={key: value for key, value in record.items() if key not in STORY_FIELDNAMES},
+                    metadata={key: value for key, value in record.items() if key not in STORY_FIELDNAMES} or None,
                 )
             )
         return stories
     raise ValueError(f"Unsupported story file format: {file_path.suffix}")
 
 
+_CSV_EOL = "\r\n"
+
+
+def _csv_cell(value: object) -> str:
+    """Format one CSV cell with csv.QUOTE_MINIMAL-compatible quoting."""
+
+    text = value if isinstance(value, str) else str(value)
+    if '"' in text or "," in text or "\n" in text or "\r" in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def make_csv_writer(fieldnames: List[str], expressions: List[str]):
+    """Compile a writer specialised for one output schema.
+
+    ``expressions`` are column expressions over a record ``x``, in header
+    order. The generated function formats each record with a single f-string,
+    skipping per-row dict construction and csv-module dispatch entirely.
+    """
+
+    cells = ",".join("{_cell(%s)}" % expression for expression in expressions)
+    source = (
+        "def _write(handle, items):\n"
+        "    write = handle.write\n"
+        f"    write({','.join(fieldnames)!r} + _EOL)\n"
+        "    for x in items:\n"
+        f"        write(f\"{cells}\" + _EOL)\n"
+    )
+    namespace = {"_cell": _csv_cell, "_EOL": _CSV_EOL}
+    exec(compile(source, "<csv-writer>", "exec"), namespace)
+    return namespace["_write"]
+
+
+def _make_row_fn(expressions: List[str]):
+    """Build a record -> tuple function for the pyarrow columnar path."""
+
+    return eval("lambda x: (" + ", ".join(expressions) + ",)")
+
+
+PROBLEM_OUT_FIELDS = [
+    "problem_id",
+    "raw_text",
+    "utterance_type",
+    "persona",
+    "desired_outcome",
+    "barrier",
+    "value_intent",
+    "domain_terms",
+    "evidence_strength",
+    "stakeholder",
+    "theme",
+    "canonical_statement",
+]
+_PROBLEM_EXPRS = [
+    "x.problem_id",
+    "x.raw_text",
+    "x.utterance_type",
+    "x.persona",
+    "x.desired_outcome",
+    "x.barrier",
+    "x.value_intent",
+    "', '.join(x.domain_terms)",
+    "x.evidence_strength",
+    "x.stakeholder or ''",
+    "x.theme or ''",
+    "x.canonical_statement",
+]
+_write_problem_rows = make_csv_writer(PROBLEM_OUT_FIELDS, _PROBLEM_EXPRS)
+_problem_row = _make_row_fn(_PROBLEM_EXPRS)
+
+STORY_OUT_FIELDS = [
+    "story_id",
+    "raw_text",
+    "persona",
+    "capability",
+    "functional_outcome",
+    "business_value",
+    "domain_terms",
+    "governance_signal",
+]
+_STORY_EXPRS = [
+    "x.story_id",
+    "x.raw_text",
+    "x.persona",
+    "x.capability",
+    "x.functional_outcome",
+    "x.business_value",
+    "', '.join(x.domain_terms)",
+    "x.governance_signal",
+]
+_write_story_rows = make_csv_writer(STORY_OUT_FIELDS, _STORY_EXPRS)
+_story_row = _make_row_fn(_STORY_EXPRS)
+
+COVERAGE_OUT_FIELDS = [
+    "problem_id",
+    "best_confidence",
+    "best_coverage",
+    "unresolved_facets",
+    "escalate",
+    "escalate_reasons",
+]
+_COVERAGE_EXPRS = [
+    "x.problem_id",
+    "x.best_confidence",
+    "x.best_coverage",
+    "', '.join(x.unresolved_facets)",
+    "'yes' if x.escalate else 'no'",
+    "', '.join(x.escalate_reasons)",
+]
+_write_coverage_rows = make_csv_writer(COVERAGE_OUT_FIELDS, _COVERAGE_EXPRS)
+_coverage_row = _make_row_fn(_COVERAGE_EXPRS)
+
+
 def write_problems(path: Path, problems: List[NormalisedProblem]) -> None:
-    fieldnames = [
-        "problem_id",
-        "raw_text",
-        "utterance_type",
-        "persona",
-        "desired_outcome",
-        "barrier",
-        "value_intent",
-        "domain_terms",
-        "evidence_strength",
-        "stakeholder",
-        "theme",
-        "canonical_statement",
-    ]
-    with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for problem in problems:
-            writer.writerow(
-                {
-                    "problem_id": problem.problem_id,
-                    "raw_text": problem.raw_text,
-                    "utterance_type": problem.utterance_type,
-                    "persona": problem.persona,
-                    "desired_outcome": problem.desired_outcome,
-                    "barrier": problem.barrier,
-                    "value_intent": problem.value_intent,
-                    "domain_terms": ", ".join(problem.domain_terms),
-                    "evidence_strength": problem.evidence_strength,
-                    "stakeholder": problem.stakeholder or "",
-                    "theme": problem.theme or "",
-                    "canonical_statement": problem.canonical_statement,
-                }
-            )
+    if pa_csv is not None:
+        _write_csv_rows(path, PROBLEM_OUT_FIELDS, map(_problem_row, problems))
+        return
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as handle:
+        _write_problem_rows(handle, problems)
 
 
 def write_stories(path: Path, stories: List[ParsedStory]) -> None:
-    fieldnames = [
-        "story_id",
-        "raw_text",
-        "persona",
-        "capability",
-        "functional_outcome",
-        "business_value",
-        "domain_terms",
-        "governance_signal",
-    ]
-    with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for story in stories:
-            writer.writerow(
-                {
-                    "story_id": story.story_id,
-                    "raw_text": story.raw_text,
-                    "persona": story.persona,
-                    "capability": story.capability,
-                    "functional_outcome": story.functional_outcome,
-                    "business_value": story.business_value,
-                    "domain_terms": ", ".join(story.domain_terms),
-                    "governance_signal": story.governance_signal,
-                }
-            )
+    if pa_csv is not None:
+        _write_csv_rows(path, STORY_OUT_FIELDS, map(_story_row, stories))
+        return
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as handle:
+        _write_story_rows(handle, stories)
 
 
-def write_edges(path: Path, edges: List[ScoredEdge]) -> None:
-    fieldnames = [
-        "problem_id",
-        "story_id",
-        "persona_alignment",
-        "capability_alignment",
-        "causal_coverage",
-        "granularity_fit",
-        "value_alignment",
-        "governance_alignment",
-        "evidence_strength_transfer",
-        "total_score",
-        "confidence_band",
-        "coverage_label",
-        "facet_coverage_json",
-        "causal_rationale",
-        "provenance_json",
-        "flags",
-    ]
-    with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for edge in edges:
-            writer.writerow(
-                {
-                    "problem_id": edge.problem_id,
-                    "story_id": edge.story_id,
-                    "persona_alignment": edge.scores["persona_alignment"],
-                    "capability_alignment": edge.scores["capability_alignment"],
-                    "causal_coverage": edge.scores["causal_coverage"],
-                    "granularity_fit": edge.scores["granularity_fit"],
-                    "value_alignment": edge.scores["value_alignment"],
-                    "governance_alignment": edge.scores["governance_alignment"],
-                    "evidence_strength_transfer": edge.scores["evidence_strength_transfer"],
-                    "total_score": edge.total_score,
-                    "confidence_band": edge.confidence_band,
-                    "coverage_label": edge.coverage_label,
-                    "facet_coverage_json": json.dumps(edge.facet_coverage, sort_keys=True),
-                    "causal_rationale": edge.causal_rationale,
-                    "provenance_json": json.dumps(edge.provenance, sort_keys=True),
-                    "flags": ", ".join(edge.flags),
-                }
-            )
+EDGE_OUT_FIELDS = [
+    "problem_id",
+    "story_id",
+    "persona_alignment",
+    "capability_alignment",
+    "causal_coverage",
+    "granularity_fit",
+    "value_alignment",
+    "governance_alignment",
+    "evidence_strength_transfer",
+    "total_score",
+    "confidence_band",
+    "coverage_label",
+    "facet_coverage_json",
+    "causal_rationale",
+    "provenance_json",
+    "flags",
+]
+def _edge_row(edge: ScoredEdge) -> tuple:
+    return (
+        (edge.problem_id, edge.story_id)
+        + edge.scores
+        + (
+            edge.total_score,
+            edge.confidence_band,
+            edge.coverage_label,
+            _facet_flags_json(edge.facet_coverage),
+            edge.causal_rationale,
+            _json_dumps_sorted(
+                edge.provenance if type(edge.provenance) is dict else dict(edge.provenance)
+            ),
+            ", ".join(edge.flags),
+        )
+    )
+
+
+def write_edges(path: Path, edges: Iterable[ScoredEdge]) -> None:
+    _write_csv_rows(path, EDGE_OUT_FIELDS, map(_edge_row, edges))
+
+
+def _tap(items: Iterable, sink) -> Iterator:
+    """Yield items unchanged while passing each one to ``sink``."""
+
+    for item in items:
+        sink(item)
+        yield item
 
 
 def write_coverage(path: Path, summaries: List[CoverageSummary]) -> None:
-    fieldnames = [
-        "problem_id",
-        "best_confidence",
-        "best_coverage",
-        "unresolved_facets",
-        "escalate",
-        "escalate_reasons",
-    ]
-    with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for summary in summaries:
-            writer.writerow(
-                {
-                    "problem_id": summary.problem_id,
-                    "unresolved_facets": ", ".join(summary.unresolved_facets),
-                    "best_confidence": summary.best_confidence,
-                    "best_coverage": summary.best_coverage,
-                    "escalate": "yes" if summary.escalate else "no",
-                    "escalate_reasons": ", ".join(summary.escalate_reasons),
-                }
+    if pa_csv is not None:
+        _write_csv_rows(path, COVERAGE_OUT_FIELDS, map(_coverage_row, summaries))
+        return
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as handle:
+        _write_coverage_rows(handle, summaries)
+
+
+def _resolve_index(header: List[str], *aliases: str) -> int | None:
+    """Return the column index of the first alias present in the header."""
+
+    for alias in aliases:
+        if alias in header:
+            return header.index(alias)
+    return None
+
+
+CHUNK_ROWS = 10_000
+
+
+def iter_problems(path: str | os.PathLike[str], chunksize: int = CHUNK_ROWS) -> Iterator[List[RawProblem]]:
+    """Yield batches of at most ``chunksize`` problems, streaming CSV input."""
+
+    file_path = Path(path)
+    if not file_path.exists():
+        raise FileNotFoundError(file_path)
+    if file_path.suffix.lower() != ".csv":
+        problems = load_problems(file_path)
+        for start in range(0, len(problems), chunksize):
+            yield problems[start : start + chunksize]
+        return
+    with file_path.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        pid_idx = _resolve_index(header, "problem_id", "PR_ID", "id")
+        text_idx = _resolve_index(header, "text", "problem_text")
+        stakeholder_idx = _resolve_index(header, "stakeholder", "persona")
+        theme_idx = _resolve_index(header, "theme")
+        meta_idx = [index for index, name in enumerate(header) if name not in PROBLEM_FIELDNAMES]
+        batch: List[RawProblem] = []
+        batch_append = batch.append
+        total = 0
+        for row in reader:
+            total += 1
+            batch_append(
+                RawProblem(
+                    problem_id=(row[pid_idx] if pid_idx is not None else "") or str(total),
+                    text=row[text_idx] if text_idx is not None else "",
+                    stakeholder=row[stakeholder_idx] if stakeholder_idx is not None else None,
+                    theme=row[theme_idx] if theme_idx is not None else None,
+                    metadata={header[index]: row[index] for index in meta_idx} if meta_idx else None,
+                )
             )
+            if len(batch) >= chunksize:
+                yield batch
+                batch = []
+                batch_append = batch.append
+        if batch:
+            yield batch
+
+
+def iter_stories(path: str | os.PathLike[str], chunksize: int = CHUNK_ROWS) -> Iterator[List[RawStory]]:
+    """Yield batches of at most ``chunksize`` stories, streaming CSV input."""
+
+    file_path = Path(path)
+    if not file_path.exists():
+        raise FileNotFoundError(file_path)
+    if file_path.suffix.lower() != ".csv":
+        stories = load_stories(file_path)
+        for start in range(0, len(stories), chunksize):
+            yield stories[start : start + chunksize]
+        return
+    with file_path.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        sid_idx = _resolve_index(header, "story_id", "BR_ID", "id")
+        text_idx = _resolve_index(header, "text", "story_text")
+        rationale_idx = _resolve_index(header, "rationale")
+        meta_idx = [index for index, name in enumerate(header) if name not in STORY_FIELDNAMES]
+        batch: List[RawStory] = []
+        batch_append = batch.append
+        total = 0
+        for row in reader:
+            total += 1
+            batch_append(
+                RawStory(
+                    story_id=(row[sid_idx] if sid_idx is not None else "") or str(total),
+                    text=row[text_idx] if text_idx is not None else "",
+                    rationale=row[rationale_idx] if rationale_idx is not None else None,
+                    metadata={header[index]: row[index] for index in meta_idx} if meta_idx else None,
+                )
+            )
+            if len(batch) >= chunksize:
+                yield batch
+                batch = []
+                batch_append = batch.append
+        if batch:
+            yield batch
+
+
+def _load_and_normalise_problems(path: str | os.PathLike[str]) -> List[NormalisedProblem]:
+    """Stream problem batches through normalisation without keeping raw rows."""
+
+    normalised: List[NormalisedProblem] = []
+    for chunk in iter_problems(path):
+        normalised.extend(normalise_problems(chunk, workers=1))
+    return normalised
+
+
+def _load_and_parse_stories(path: str | os.PathLike[str]) -> List[ParsedStory]:
+    """Stream story batches through parsing without keeping raw rows."""
+
+    parsed: List[ParsedStory] = []
+    for chunk in iter_stories(path):
+        parsed.extend(parse_stories(chunk, workers=1))
+    return parsed
+
 
 
 def run_pipeline(
@@ -293,22 +640,45 @@ def run_pipeline(
     stories_path: str | os.PathLike[str],
     output_dir: str | os.PathLike[str],
     config: AgentConfig | None = None,
+    parallel: bool = True,
 ) -> None:
     if config is None:
         config = AgentConfig()
-    problems = load_problems(problems_path)
-    stories = load_stories(stories_path)
+    if parallel:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            problems_future = executor.submit(_load_and_normalise_problems, problems_path)
+            stories_future = executor.submit(_load_and_parse_stories, stories_path)
+            normalised_problems = problems_future.result()
+            parsed_stories = stories_future.result()
+    else:
+        normalised_problems = _load_and_normalise_problems(problems_path)
+        parsed_stories = _load_and_parse_stories(stories_path)
 
-    normalised_problems = normalise_problems(problems)
-    parsed_stories = parse_stories(stories)
-    candidate_pairs = propose_pairs(normalised_problems, parsed_stories, config)
-    edges = score_pairs(candidate_pairs, config)
-    summaries = coverage_summaries(normalised_problems, edges)
+    edges = pair_and_score(normalised_problems, parsed_stories, config)
 
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
+    edges_path = output_path / "Edges.csv"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        writes = [
+            executor.submit(write_problems, output_path / "Problems_Normalised.csv", normalised_problems),
+            executor.submit(write_stories, output_path / "Stories_Parsed.csv", parsed_stories),
+        ]
+        if pa_csv is not None:
+            # The columnar writer needs the full table anyway.
+            materialised = list(edges)
+            write_edges(edges_path, materialised)
+            summaries = coverage_summaries(normalised_problems, materialised)
+        else:
+            with edges_path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as handle:
+                writer = csv.writer(handle)
+                writer.writerow(EDGE_OUT_FIELDS)
+                summaries = coverage_summaries(
+                    normalised_problems,
+                    _tap(edges, lambda edge: writer.writerow(_edge_row(edge))),
+                )
+        for write in writes:
+            write.result()
 
-    write_problems(output_path / "Problems_Normalised.csv", normalised_problems)
-    write_stories(output_path / "Stories_Parsed.csv", parsed_stories)
-    write_edges(output_path / "Edges.csv", edges)
     write_coverage(output_path / "Coverage_Summary.csv", summaries)
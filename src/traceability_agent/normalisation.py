@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 
 from .data_models import NormalisedProblem, RawProblem, iter_domain_terms
@@ -12,17 +13,27 @@ from .text_utils import (
     infer_persona,
     infer_value_intent,
     keyphrase_candidates,
+    keyword_set,
+    role_tokens,
 )
 
 
-UTTERANCE_TYPE_RULES = [
-    (re.compile(r"\bneed(s)?\b", re.IGNORECASE), "need"),
-    (re.compile(r"\bwant\b", re.IGNORECASE), "need"),
-    (re.compile(r"\brequest\b", re.IGNORECASE), "solution_request"),
-    (re.compile(r"\bshould\b", re.IGNORECASE), "action_description"),
-    (re.compile(r"\bcan't\b|cannot|unable", re.IGNORECASE), "failure"),
-    (re.compile(r"\bfail|friction|pain|struggle\b", re.IGNORECASE), "pain_statement"),
-]
+UTTERANCE_TYPE_RE = re.compile(
+    r"(?P<need>\bneed(?:s)?\b|\bwant\b)"
+    r"|(?P<solution_request>\brequest\b)"
+    r"|(?P<action_description>\bshould\b)"
+    r"|(?P<failure>\bcan't\b|cannot|unable)"
+    r"|(?P<pain_statement>\bfail|friction|pain|struggle\b)",
+    re.IGNORECASE,
+)
+
+UTTERANCE_PRIORITY = {
+    "need": 0,
+    "solution_request": 1,
+    "action_description": 2,
+    "failure": 3,
+    "pain_statement": 4,
+}
 
 DEFAULT_UTTERANCE = "pain_statement"
 
@@ -30,10 +41,16 @@ DEFAULT_UTTERANCE = "pain_statement"
 def classify_utterance(text: str) -> str:
     """Classify utterance type based on keyword heuristics."""
 
-    for pattern, label in UTTERANCE_TYPE_RULES:
-        if pattern.search(text):
-            return label
-    return DEFAULT_UTTERANCE
+    best: str | None = None
+    best_rank = len(UTTERANCE_PRIORITY)
+    for match in UTTERANCE_TYPE_RE.finditer(text):
+        rank = UTTERANCE_PRIORITY[match.lastgroup]
+        if rank < best_rank:
+            best = match.lastgroup
+            best_rank = rank
+            if rank == 0:
+                break
+    return best or DEFAULT_UTTERANCE
 
 
 def normalise_problem(problem: RawProblem) -> NormalisedProblem:
@@ -62,10 +79,23 @@ def normalise_problem(problem: RawProblem) -> NormalisedProblem:
         stakeholder=problem.stakeholder,
         theme=problem.theme,
         metadata=problem.metadata,
+        persona_tokens=role_tokens(persona),
+        capability_terms=keyword_set(f"{desired_outcome} {barrier}"),
+        barrier_terms=keyword_set(barrier),
+        value_terms=keyword_set(value),
+        governance_terms=keyword_set(f"{barrier} {value}"),
+        barrier_lower=barrier.lower(),
+        domain_terms_set=frozenset(domain_terms),
     )
 
 
-def normalise_problems(problems: List[RawProblem]) -> List[NormalisedProblem]:
-    """Normalise a collection of problems."""
+PARALLEL_THRESHOLD = 512
+
+
+def normalise_problems(problems: List[RawProblem], workers: int | None = None) -> List[NormalisedProblem]:
+    """Normalise a collection of problems, forking workers for large batches."""
 
+    if workers != 1 and len(problems) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(normalise_problem, problems, chunksize=64))
     return [normalise_problem(problem) for problem in problems]
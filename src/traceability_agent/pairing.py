@@ -2,16 +2,64 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import re
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, Iterable, List, Sequence, Tuple
-
-from .data_models import CoverageSummary, NormalisedProblem, ParsedStory, ScoredEdge
-from .text_utils import cosine_overlap, jaccard_similarity, keyword_set, normalise_text
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+from .data_models import (
+    FACET_FIELDS,
+    SCORE_FIELDS,
+    CoverageSummary,
+    FacetScores,
+    NormalisedProblem,
+    ParsedStory,
+    ScoredEdge,
+)
+from .text_utils import (
+    Vocabulary,
+    cosine_bits,
+    jaccard_bits,
+    keyword_set,
+    role_tokens,
+)
 
 
 ESSENTIAL_FACETS = ("capability", "causal_root", "value")
+_ESSENTIAL_MASK = sum(1 << FACET_FIELDS.index(facet) for facet in ESSENTIAL_FACETS)
+
+_PROMPT_VERSIONS = {
+    "problem_norm": "v1",
+    "story_parse": "v1",
+    "causal_judge": "v1",
+    "value_align": "v1",
+}
+
+
+def _batch_provenance(created_at: str) -> Mapping[str, object]:
+    """Build the one immutable provenance mapping shared by a scoring batch."""
+
+    return MappingProxyType(
+        {
+            "created_at": created_at,
+            "prompt_versions": _PROMPT_VERSIONS,
+            "notes": "heuristic_rule_based",
+        }
+    )
+
+# Integer indices into ScoredEdge.scores, matching SCORE_FIELDS order.
+(
+    S_PERSONA,
+    S_CAPABILITY,
+    S_CAUSAL,
+    S_GRANULARITY,
+    S_VALUE,
+    S_GOVERNANCE,
+    S_EVIDENCE,
+) = range(len(SCORE_FIELDS))
 
 
 @dataclass(slots=True)
@@ -37,94 +85,243 @@ class AgentConfig:
         "control",
         "compliance",
     )
+    governance_term_set: frozenset = field(init=False)
+    governance_term_re: re.Pattern = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.governance_term_set = frozenset(self.governance_terms)
+        self.governance_term_re = re.compile("|".join(map(re.escape, self.governance_terms)))
+
+
+@dataclass(slots=True)
+class _ConfigCtx:
+    """Scoring constants derived from AgentConfig once per batch."""
+
+    governance_terms: frozenset
+    governance_re: re.Pattern
+    governance_bits: int
+    vocabulary: Vocabulary
+    high_confidence: int
+    medium_confidence: int
+    borderline_low: int
+    borderline_high: int
+
+
+def _config_ctx(config: AgentConfig) -> _ConfigCtx:
+    low, high = config.threshold.borderline_band
+    vocabulary = Vocabulary()
+    return _ConfigCtx(
+        governance_terms=config.governance_term_set,
+        governance_re=config.governance_term_re,
+        governance_bits=vocabulary.bitset(config.governance_term_set),
+        vocabulary=vocabulary,
+        high_confidence=config.threshold.high_confidence,
+        medium_confidence=config.threshold.medium_confidence,
+        borderline_low=low,
+        borderline_high=high,
+    )
+
+
+@dataclass(slots=True)
+class _ProblemContext:
+    """Interned bitsets derived once per problem and reused across every pairing."""
+
+    problem: NormalisedProblem
+    persona_bits: int
+    capability_bits: int
+    barrier_bits: int
+    value_bits: int
+    governance_bits: int
+    domain_bits: int
+    has_governance_barrier: bool
+    phrase_length: int
+
+
+def _problem_context(problem: NormalisedProblem, cfg: _ConfigCtx) -> _ProblemContext:
+    barrier_lower = problem.barrier_lower
+    if barrier_lower is None:
+        barrier_lower = problem.barrier.lower()
+    bitset = cfg.vocabulary.bitset
+    persona_tokens = problem.persona_tokens
+    if persona_tokens is None:
+        persona_tokens = role_tokens(problem.persona)
+    capability_terms = problem.capability_terms
+    if capability_terms is None:
+        capability_terms = keyword_set(f"{problem.desired_outcome} {problem.barrier}")
+    barrier_terms = problem.barrier_terms
+    if barrier_terms is None:
+        barrier_terms = keyword_set(problem.barrier)
+    value_terms = problem.value_terms
+    if value_terms is None:
+        value_terms = keyword_set(problem.value_intent)
+    governance_terms = problem.governance_terms
+    if governance_terms is None:
+        governance_terms = keyword_set(f"{problem.barrier} {problem.value_intent}")
+    return _ProblemContext(
+        problem=problem,
+        persona_bits=bitset(persona_tokens),
+        capability_bits=bitset(capability_terms),
+        barrier_bits=bitset(barrier_terms),
+        value_bits=bitset(value_terms),
+        governance_bits=bitset(governance_terms),
+        domain_bits=bitset(problem.domain_terms),
+        has_governance_barrier=cfg.governance_re.search(barrier_lower) is not None,
+        phrase_length=len(problem.desired_outcome.split()) + len(problem.barrier.split()),
+    )
 
 
-def _role_tokens(role: str) -> set[str]:
-    return {token for token in normalise_text(role).split() if token}
+@dataclass(slots=True)
+class _StoryContext:
+    """Interned bitsets derived once per story and reused across every pairing."""
+
+    story: ParsedStory
+    persona_bits: int
+    capability_bits: int
+    capability_or_raw_bits: int
+    value_bits: int
+    raw_bits: int
+    domain_bits: int
+    governance_bridge: bool
+    capability_length: int
+
+
+def _story_context(story: ParsedStory, cfg: _ConfigCtx) -> _StoryContext:
+    bitset = cfg.vocabulary.bitset
+    persona_tokens = story.persona_tokens
+    if persona_tokens is None:
+        persona_tokens = role_tokens(story.persona)
+    capability_terms = story.capability_terms
+    if capability_terms is None:
+        capability_terms = keyword_set(story.capability)
+    value_terms = story.value_terms
+    if value_terms is None:
+        value_terms = keyword_set(story.business_value)
+    raw_terms = story.raw_terms
+    if raw_terms is None:
+        raw_terms = keyword_set(story.raw_text)
+    capability_bits = bitset(capability_terms)
+    raw_bits = bitset(raw_terms)
+    return _StoryContext(
+        story=story,
+        persona_bits=bitset(persona_tokens),
+        capability_bits=capability_bits,
+        capability_or_raw_bits=capability_bits or raw_bits,
+        value_bits=bitset(value_terms),
+        raw_bits=raw_bits,
+        domain_bits=bitset(story.domain_terms),
+        governance_bridge=story.governance_signal >= 1,
+        capability_length=len(story.capability.split()),
+    )
 
 
-def persona_alignment(problem: NormalisedProblem, story: ParsedStory) -> int:
+def _candidate_index(
+    story_contexts: List[_StoryContext],
+) -> Tuple[Dict[str, List[int]], Dict[str, List[int]], List[int]]:
+    """Posting lists from persona tokens and domain terms to story indices."""
+
+    by_persona: Dict[str, List[int]] = {}
+    by_domain: Dict[str, List[int]] = {}
+    governance: List[int] = []
+    for index, story_ctx in enumerate(story_contexts):
+        story = story_ctx.story
+        story_persona = story.persona_tokens
+        if story_persona is None:
+            story_persona = role_tokens(story.persona)
+        for token in story_persona:
+            by_persona.setdefault(token, []).append(index)
+        for term in story.domain_terms:
+            by_domain.setdefault(term, []).append(index)
+        if story_ctx.governance_bridge:
+            governance.append(index)
+    return by_persona, by_domain, governance
+
+
+def _candidate_ids(
+    problem_ctx: _ProblemContext,
+    by_persona: Dict[str, List[int]],
+    by_domain: Dict[str, List[int]],
+    governance: List[int],
+) -> List[int]:
+    """Union the posting lists matching one problem, in story order."""
+
+    problem = problem_ctx.problem
+    ids: set[int] = set()
+    persona_tokens = problem.persona_tokens
+    if persona_tokens is None:
+        persona_tokens = role_tokens(problem.persona)
+    for token in persona_tokens:
+        ids.update(by_persona.get(token, ()))
+    for term in problem.domain_terms:
+        ids.update(by_domain.get(term, ()))
+    if problem_ctx.has_governance_barrier:
+        ids.update(governance)
+    return sorted(ids)
+
+
+def _band2(value: float, lo: float, hi: float) -> int:
+    """Branchless two-threshold banding: returns 0, 1 or 2."""
+
+    return (value >= lo) + (value >= hi)
+
+
+def persona_alignment(problem_ctx: _ProblemContext, story_ctx: _StoryContext) -> int:
     """Score persona alignment (0–2)."""
 
-    prob_tokens = _role_tokens(problem.persona)
-    story_tokens = _role_tokens(story.persona)
-    if not prob_tokens or not story_tokens:
+    prob_bits = problem_ctx.persona_bits
+    story_bits = story_ctx.persona_bits
+    if not prob_bits or not story_bits:
         return 0
-    if prob_tokens == story_tokens or prob_tokens.issubset(story_tokens) or story_tokens.issubset(prob_tokens):
+    common = prob_bits & story_bits
+    if common == prob_bits or common == story_bits:
         return 2
-    if prob_tokens & story_tokens:
+    if common:
         return 1
     return 0
 
 
-def capability_alignment(problem: NormalisedProblem, story: ParsedStory) -> int:
+def capability_alignment(problem_ctx: _ProblemContext, story_ctx: _StoryContext) -> int:
     """Score capability alignment (0–2)."""
 
-    problem_terms = keyword_set(f"{problem.desired_outcome} {problem.barrier}")
-    story_terms = keyword_set(story.capability)
-    if not story_terms:
-        story_terms = keyword_set(story.raw_text)
-    overlap = cosine_overlap(problem_terms, story_terms)
-    if overlap >= 0.5:
-        return 2
-    if overlap >= 0.2:
-        return 1
-    return 0
+    return _band2(cosine_bits(problem_ctx.capability_bits, story_ctx.capability_or_raw_bits), 0.2, 0.5)
 
 
-def causal_coverage(problem: NormalisedProblem, story: ParsedStory) -> int:
+def causal_coverage(problem_ctx: _ProblemContext, story_ctx: _StoryContext) -> int:
     """Score causal coverage (0–2)."""
 
-    barrier_terms = keyword_set(problem.barrier)
-    capability_terms = keyword_set(story.capability)
-    if not barrier_terms or not capability_terms:
+    barrier_bits = problem_ctx.barrier_bits
+    capability_bits = story_ctx.capability_bits
+    if not barrier_bits or not capability_bits:
         return 0
-    overlap = jaccard_similarity(barrier_terms, capability_terms)
-    if overlap >= 0.4:
-        return 2
-    if overlap >= 0.2:
-        return 1
-    return 0
+    return _band2(jaccard_bits(barrier_bits, capability_bits), 0.2, 0.4)
 
 
-def granularity_fit(problem: NormalisedProblem, story: ParsedStory) -> int:
+def granularity_fit(problem_ctx: _ProblemContext, story_ctx: _StoryContext) -> int:
     """Score granularity fit (0–2)."""
 
-    problem_length = len(problem.desired_outcome.split()) + len(problem.barrier.split())
-    story_length = len(story.capability.split())
+    story_length = story_ctx.capability_length
     if story_length == 0:
         return 0
-    ratio = problem_length / story_length
-    if 0.5 <= ratio <= 1.5:
-        return 2
-    if 0.3 <= ratio <= 2.0:
-        return 1
-    return 0
+    ratio = problem_ctx.phrase_length / story_length
+    return (0.3 <= ratio <= 2.0) + (0.5 <= ratio <= 1.5)
 
 
-def value_alignment(problem: NormalisedProblem, story: ParsedStory) -> int:
+def value_alignment(problem_ctx: _ProblemContext, story_ctx: _StoryContext) -> int:
     """Score value alignment (0–2)."""
 
-    problem_terms = keyword_set(problem.value_intent)
-    story_terms = keyword_set(story.business_value)
-    overlap = jaccard_similarity(problem_terms, story_terms)
-    if overlap >= 0.4:
-        return 2
-    if overlap >= 0.2:
-        return 1
-    return 0
+    return _band2(jaccard_bits(problem_ctx.value_bits, story_ctx.value_bits), 0.2, 0.4)
 
 
-def governance_alignment(problem: NormalisedProblem, story: ParsedStory, config: AgentConfig) -> int:
+def governance_alignment(problem_ctx: _ProblemContext, story_ctx: _StoryContext, cfg: _ConfigCtx) -> int:
     """Score governance/policy alignment (0–2)."""
 
-    problem_terms = keyword_set(f"{problem.barrier} {problem.value_intent}")
-    story_terms = keyword_set(story.raw_text)
-    strong_terms = set(config.governance_terms)
-    if story.governance_signal == 2 or (problem_terms & strong_terms):
-        if story.governance_signal >= 1 or (story_terms & strong_terms):
+    problem_bits = problem_ctx.governance_bits
+    story_bits = story_ctx.raw_bits
+    governance_signal = story_ctx.story.governance_signal
+    strong_bits = cfg.governance_bits
+    if governance_signal == 2 or problem_bits & strong_bits:
+        if governance_signal >= 1 or story_bits & strong_bits:
             return 2
-    if story.governance_signal >= 1 or (problem_terms & story_terms):
+    if governance_signal >= 1 or problem_bits & story_bits:
         return 1
     return 0
 
@@ -135,25 +332,32 @@ def evidence_transfer(problem: NormalisedProblem) -> int:
     return max(0, min(problem.evidence_strength, 2))
 
 
-def compute_facet_flags(scores: Dict[str, int]) -> Dict[str, bool]:
+def compute_facet_mask(scores: FacetScores) -> int:
+    """Pack the rubric facet flags into a bitmask ordered as FACET_FIELDS."""
+
+    return (
+        (scores[S_PERSONA] == 2)
+        | (scores[S_CAPABILITY] >= 1) << 1
+        | (scores[S_CAUSAL] == 2) << 2
+        | (scores[S_VALUE] >= 1) << 3
+        | (scores[S_GOVERNANCE] >= 1) << 4
+        | (scores[S_GRANULARITY] >= 1) << 5
+    )
+
+
+def compute_facet_flags(scores: FacetScores) -> Dict[str, bool]:
     """Return facet coverage flags using rubric definitions."""
 
-    return {
-        "persona": scores["persona_alignment"] == 2,
-        "capability": scores["capability_alignment"] >= 1,
-        "causal_root": scores["causal_coverage"] == 2,
-        "value": scores["value_alignment"] >= 1,
-        "governance": scores["governance_alignment"] >= 1,
-        "granularity_compatible": scores["granularity_fit"] >= 1,
-    }
+    mask = compute_facet_mask(scores)
+    return {name: bool(mask >> bit & 1) for bit, name in enumerate(FACET_FIELDS)}
 
 
-def confidence_band(total_score: int, problem: NormalisedProblem, scores: Dict[str, int], threshold: ThresholdConfig) -> str:
+def confidence_band(total_score: int, problem: NormalisedProblem, scores: FacetScores, cfg: _ConfigCtx) -> str:
     """Derive confidence band with vision caps applied."""
 
-    if total_score >= threshold.high_confidence:
+    if total_score >= cfg.high_confidence:
         band = "High"
-    elif total_score >= threshold.medium_confidence:
+    elif total_score >= cfg.medium_confidence:
         band = "Medium"
     elif total_score > 0:
         band = "Low"
@@ -161,29 +365,29 @@ def confidence_band(total_score: int, problem: NormalisedProblem, scores: Dict[s
         band = "None"
 
     if problem.evidence_strength == 0 and band == "High":
-        if not (scores["capability_alignment"] == 2 and scores["causal_coverage"] == 2):
+        if not (scores[S_CAPABILITY] == 2 and scores[S_CAUSAL] == 2):
             band = "Medium"
     return band
 
 
-def coverage_label(band: str, facets: Dict[str, bool]) -> str:
+def coverage_label(band: str, facet_mask: int) -> str:
     """Label coverage according to essentials-first rule."""
 
-    if facets["capability"] and facets["causal_root"] and facets["value"]:
+    if facet_mask & _ESSENTIAL_MASK == _ESSENTIAL_MASK:
         return "Full"
     if band in {"High", "Medium"}:
         return "Partial"
     return "None"
 
 
-def causal_rationale(problem: NormalisedProblem, story: ParsedStory, scores: Dict[str, int]) -> str:
+def causal_rationale(problem: NormalisedProblem, story: ParsedStory, scores: FacetScores) -> str:
     """Generate a single-sentence rationale."""
 
-    if scores["causal_coverage"] == 2:
+    if scores[S_CAUSAL] == 2:
         return (
             f"{story.capability} neutralises the barrier '{problem.barrier}', enabling {problem.persona} to achieve {problem.desired_outcome}."
         )
-    if scores["capability_alignment"] >= 1:
+    if scores[S_CAPABILITY] >= 1:
         return (
             f"{story.capability} helps {problem.persona} progress towards {problem.desired_outcome} but does not fully remove '{problem.barrier}'."
         )
@@ -195,123 +399,243 @@ def causal_rationale(problem: NormalisedProblem, story: ParsedStory, scores: Dic
 def candidate_pair(problem: NormalisedProblem, story: ParsedStory, config: AgentConfig) -> bool:
     """Determine whether a problem/story pair should be scored."""
 
-    persona_match = persona_alignment(problem, story) > 0
-    domain_overlap = bool(set(problem.domain_terms) & set(story.domain_terms))
+    persona_match = bool(
+        (problem.persona_tokens or role_tokens(problem.persona))
+        & (story.persona_tokens or role_tokens(story.persona))
+    )
+    problem_domains = problem.domain_terms_set
+    if problem_domains is None:
+        problem_domains = frozenset(problem.domain_terms)
+    story_domains = story.domain_terms_set
+    if story_domains is None:
+        story_domains = frozenset(story.domain_terms)
+    domain_overlap = not problem_domains.isdisjoint(story_domains)
+    barrier_lower = problem.barrier_lower
+    if barrier_lower is None:
+        barrier_lower = problem.barrier.lower()
     governance_bridge = (
         story.governance_signal >= 1
-        and any(term in problem.barrier.lower() for term in config.governance_terms)
+        and config.governance_term_re.search(barrier_lower) is not None
     )
     return persona_match or domain_overlap or governance_bridge
 
 
 def propose_pairs(
     problems: List[NormalisedProblem], stories: List[ParsedStory], config: AgentConfig | None = None
-) -> List[Tuple[NormalisedProblem, ParsedStory]]:
-    """Stage 3 pairing – return candidate problem/story tuples."""
+) -> Iterator[Tuple[NormalisedProblem, ParsedStory]]:
+    """Stage 3 pairing – yield candidate problem/story tuples lazily."""
 
     if config is None:
         config = AgentConfig()
-    pairs: List[Tuple[NormalisedProblem, ParsedStory]] = []
+    cfg = _config_ctx(config)
+    story_contexts = [_story_context(story, cfg) for story in stories]
+    by_persona, by_domain, governance = _candidate_index(story_contexts)
     for problem in problems:
-        for story in stories:
-            if candidate_pair(problem, story, config):
-                pairs.append((problem, story))
-    return pairs
+        problem_ctx = _problem_context(problem, cfg)
+        for index in _candidate_ids(problem_ctx, by_persona, by_domain, governance):
+            yield problem, story_contexts[index].story
 
 
 def score_pair(problem: NormalisedProblem, story: ParsedStory, config: AgentConfig) -> ScoredEdge:
     """Score a single candidate pair."""
 
-    scores = {
-        "persona_alignment": persona_alignment(problem, story),
-        "capability_alignment": capability_alignment(problem, story),
-        "causal_coverage": causal_coverage(problem, story),
-        "granularity_fit": granularity_fit(problem, story),
-        "value_alignment": value_alignment(problem, story),
-        "governance_alignment": governance_alignment(problem, story, config),
-        "evidence_strength_transfer": evidence_transfer(problem),
-    }
-    total = sum(scores.values())
-    facets = compute_facet_flags(scores)
-    band = confidence_band(total, problem, scores, config.threshold)
-    coverage = coverage_label(band, facets)
-    rationale = causal_rationale(problem, story, scores)
-
-    flags: List[str] = []
-    low, high = config.threshold.borderline_band
-    if low <= total <= high and band == "Medium":
-        flags.append("borderline_medium")
-    if band == "High" and problem.evidence_strength <= 1:
-        flags.append("high_needs_review")
-
-    provenance = {
-        "created_at": datetime.utcnow().isoformat(),
-        "prompt_versions": {
-            "problem_norm": "v1",
-            "story_parse": "v1",
-            "causal_judge": "v1",
-            "value_align": "v1",
-        },
-        "notes": "heuristic_rule_based",
-    }
-
-    return ScoredEdge(
-        problem_id=problem.problem_id,
-        story_id=story.story_id,
-        scores=scores,
-        total_score=total,
-        confidence_band=band,
-        facet_coverage=facets,
-        coverage_label=coverage,
-        causal_rationale=rationale,
-        provenance=provenance,
-        flags=flags,
-    )
+    cfg = _config_ctx(config)
+    provenance = _batch_provenance(datetime.now(timezone.utc).isoformat(timespec="seconds"))
+    scorer = _context_scorer(_problem_context(problem, cfg), cfg, provenance)
+    return scorer(_story_context(story, cfg))
+
+
+def _context_scorer(
+    problem_ctx: _ProblemContext, cfg: _ConfigCtx, provenance: Mapping[str, object]
+):
+    """Specialise scoring for one problem by hoisting its invariants.
+
+    Returns a closure that scores story contexts with every problem-side
+    value already bound to a local, so the inner loop touches no problem
+    attributes and makes no per-facet function calls.
+    """
+
+    problem = problem_ctx.problem
+    persona_bits = problem_ctx.persona_bits
+    capability_bits = problem_ctx.capability_bits
+    barrier_bits = problem_ctx.barrier_bits
+    value_bits = problem_ctx.value_bits
+    governance_bits = problem_ctx.governance_bits
+    phrase_length = problem_ctx.phrase_length
+    evidence = evidence_transfer(problem)
+    strong_bits = cfg.governance_bits
+
+    def score(story_ctx: _StoryContext) -> ScoredEdge:
+        story = story_ctx.story
+
+        story_persona = story_ctx.persona_bits
+        common = persona_bits & story_persona
+        if not common:
+            persona_score = 0
+        elif common == persona_bits or common == story_persona:
+            persona_score = 2
+        else:
+            persona_score = 1
+
+        overlap = cosine_bits(capability_bits, story_ctx.capability_or_raw_bits)
+        capability_score = (overlap >= 0.2) + (overlap >= 0.5)
+
+        story_capability = story_ctx.capability_bits
+        if barrier_bits and story_capability:
+            overlap = jaccard_bits(barrier_bits, story_capability)
+            causal_score = (overlap >= 0.2) + (overlap >= 0.4)
+        else:
+            causal_score = 0
+
+        story_length = story_ctx.capability_length
+        if story_length == 0:
+            granularity_score = 0
+        else:
+            ratio = phrase_length / story_length
+            granularity_score = (0.3 <= ratio <= 2.0) + (0.5 <= ratio <= 1.5)
+
+        overlap = jaccard_bits(value_bits, story_ctx.value_bits)
+        value_score = (overlap >= 0.2) + (overlap >= 0.4)
+
+        governance_signal = story.governance_signal
+        governance_score = 0
+        if governance_signal == 2 or governance_bits & strong_bits:
+            if governance_signal >= 1 or story_ctx.raw_bits & strong_bits:
+                governance_score = 2
+        if not governance_score and (governance_signal >= 1 or governance_bits & story_ctx.raw_bits):
+            governance_score = 1
+
+        scores = FacetScores(
+            persona_score,
+            capability_score,
+            causal_score,
+            granularity_score,
+            value_score,
+            governance_score,
+            evidence,
+        )
+        total = sum(scores)
+        facet_mask = compute_facet_mask(scores)
+        band = confidence_band(total, problem, scores, cfg)
+        coverage = coverage_label(band, facet_mask)
+        rationale = causal_rationale(problem, story, scores)
+
+        flags: List[str] = []
+        if cfg.borderline_low <= total <= cfg.borderline_high and band == "Medium":
+            flags.append("borderline_medium")
+        if band == "High" and problem.evidence_strength <= 1:
+            flags.append("high_needs_review")
+
+        return ScoredEdge(
+            problem_id=problem.problem_id,
+            story_id=story.story_id,
+            scores=scores,
+            total_score=total,
+            confidence_band=band,
+            facet_coverage=facet_mask,
+            coverage_label=coverage,
+            causal_rationale=rationale,
+            provenance=provenance,
+            flags=flags,
+        )
+
+    return score
+
+
+def make_problem_scorer(problem: NormalisedProblem, config: AgentConfig | None = None):
+    """Return a closure scoring parsed stories against one fixed problem."""
+
+    if config is None:
+        config = AgentConfig()
+    cfg = _config_ctx(config)
+    provenance = _batch_provenance(datetime.now(timezone.utc).isoformat(timespec="seconds"))
+    scorer = _context_scorer(_problem_context(problem, cfg), cfg, provenance)
+
+    def score(story: ParsedStory) -> ScoredEdge:
+        return scorer(_story_context(story, cfg))
+
+    return score
 
 
 def score_pairs(
     pairs: Iterable[Tuple[NormalisedProblem, ParsedStory]], config: AgentConfig | None = None
-) -> List[ScoredEdge]:
-    """Stage 4 scoring – evaluate each candidate pair."""
+) -> Iterator[ScoredEdge]:
+    """Stage 4 scoring – lazily evaluate each candidate pair."""
 
     if config is None:
         config = AgentConfig()
-    edges: List[ScoredEdge] = []
+    cfg = _config_ctx(config)
+    provenance = _batch_provenance(datetime.now(timezone.utc).isoformat(timespec="seconds"))
+    scorers: Dict[int, object] = {}
+    story_contexts: Dict[int, _StoryContext] = {}
     for problem, story in pairs:
-        edges.append(score_pair(problem, story, config))
-    return edges
+        scorer = scorers.get(id(problem))
+        if scorer is None:
+            scorer = scorers[id(problem)] = _context_scorer(_problem_context(problem, cfg), cfg, provenance)
+        story_ctx = story_contexts.get(id(story))
+        if story_ctx is None:
+            story_ctx = story_contexts[id(story)] = _story_context(story, cfg)
+        yield scorer(story_ctx)
+
+
+def pair_and_score(
+    problems: List[NormalisedProblem], stories: List[ParsedStory], config: AgentConfig | None = None
+) -> Iterator[ScoredEdge]:
+    """Stages 3+4 fused – propose and score pairs sharing one context cache."""
+
+    if config is None:
+        config = AgentConfig()
+    cfg = _config_ctx(config)
+    provenance = _batch_provenance(datetime.now(timezone.utc).isoformat(timespec="seconds"))
+    story_contexts = [_story_context(story, cfg) for story in stories]
+    by_persona, by_domain, governance = _candidate_index(story_contexts)
+    for problem in problems:
+        problem_ctx = _problem_context(problem, cfg)
+        score = _context_scorer(problem_ctx, cfg, provenance)
+        for index in _candidate_ids(problem_ctx, by_persona, by_domain, governance):
+            yield score(story_contexts[index])
 
 
 def coverage_summaries(
     problems: List[NormalisedProblem], edges: Iterable[ScoredEdge]
 ) -> List[CoverageSummary]:
-    """Stage 5 review summaries and escalation hints."""
+    """Stage 5 review summaries and escalation hints.
+
+    ``edges`` must be grouped by ``problem_id``, which ``score_pairs`` and
+    ``pair_and_score`` guarantee by iterating problems in their outer loop.
+    """
 
     problem_lookup: Dict[str, NormalisedProblem] = {problem.problem_id: problem for problem in problems}
-    grouped: Dict[str, List[ScoredEdge]] = defaultdict(list)
-    for edge in edges:
-        grouped[edge.problem_id].append(edge)
+    seen: set[str] = set()
 
     summaries: List[CoverageSummary] = []
-    for problem_id, entries in grouped.items():
-        best_edge = max(entries, key=lambda edge: edge.total_score)
-        unresolved_facets = [
-            facet
-            for facet in ("persona", "capability", "causal_root", "value", "governance", "granularity_compatible")
-            if not any(edge.facet_coverage[facet] for edge in entries)
-        ]
+    for problem_id, group in groupby(edges, key=attrgetter("problem_id")):
+        seen.add(problem_id)
+        best_edge = None
+        best_total = -1
+        covered = 0
+        has_full = False
+        has_borderline = False
+        has_high = False
+        for edge in group:
+            if edge.total_score > best_total:
+                best_total = edge.total_score
+                best_edge = edge
+            covered |= edge.facet_coverage
+            has_full = has_full or edge.coverage_label == "Full"
+            has_borderline = has_borderline or "borderline_medium" in edge.flags
+            has_high = has_high or edge.confidence_band == "High"
+        unresolved_facets = [name for bit, name in enumerate(FACET_FIELDS) if not covered >> bit & 1]
 
         reasons: List[str] = []
-        if not any(edge.coverage_label == "Full" for edge in entries):
+        if not has_full:
             reasons.append("no_full_coverage")
-        if any("borderline" in "_".join(edge.flags) for edge in entries):
+        if has_borderline:
             reasons.append("borderline_medium")
         problem = problem_lookup.get(problem_id)
-        if problem and any(
-            edge.confidence_band == "High" and problem.evidence_strength <= 1 for edge in entries
-        ):
+        if problem and has_high and problem.evidence_strength <= 1:
             reasons.append("high_with_low_evidence")
-        if any(facet in unresolved_facets for facet in ESSENTIAL_FACETS):
+        if covered & _ESSENTIAL_MASK != _ESSENTIAL_MASK:
             reasons.append("residual_gaps")
 
         summaries.append(
@@ -327,13 +651,13 @@ def coverage_summaries(
 
     # Include problems without any candidate edges for completeness.
     for problem in problems:
-        if problem.problem_id not in grouped:
+        if problem.problem_id not in seen:
             summaries.append(
                 CoverageSummary(
                     problem_id=problem.problem_id,
                     best_confidence="None",
                     best_coverage="None",
-                    unresolved_facets=["persona", "capability", "causal_root", "value", "governance", "granularity_compatible"],
+                    unresolved_facets=list(FACET_FIELDS),
                     escalate=True,
                     escalate_reasons=["no_pairs"],
                 )
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 
 from .data_models import ParsedStory, RawStory, iter_domain_terms
-from .text_utils import keyphrase_candidates
+from .text_utils import keyphrase_candidates, keyword_set, role_tokens
 
 STORY_PATTERN = re.compile(
-    r"as an? (?P<persona>[^,]+?),\s*i want (?P<capability>[^.]+?)(?:,?\s*so that (?P<outcome>[^.]+))?",
+    r"as an? (?P<persona>[^,]+?),\s*i want (?P<capability>[^.]+?)(?:,?\s*so that (?P<outcome>[^.]+))?"
+    r"|i need to (?P<need>[^.,]+)",
     re.IGNORECASE,
 )
 
@@ -30,14 +32,18 @@ GOVERNANCE_KEYWORDS = {
     "access",
 }
 
+GOVERNANCE_STRONG_RE = re.compile("|".join(("policy", "audit", "governance", "lineage")))
+GOVERNANCE_ANY_RE = re.compile("|".join(sorted(GOVERNANCE_KEYWORDS)))
 
-def governance_signal(text: str) -> int:
+
+def governance_signal(text: str, lowered: str | None = None) -> int:
     """Return governance signal strength derived from the story text."""
 
-    lowered = text.lower()
-    if any(keyword in lowered for keyword in ("policy", "audit", "governance", "lineage")):
+    if lowered is None:
+        lowered = text.lower()
+    if GOVERNANCE_STRONG_RE.search(lowered):
         return 2
-    if any(keyword in lowered for keyword in GOVERNANCE_KEYWORDS):
+    if GOVERNANCE_ANY_RE.search(lowered):
         return 1
     return 0
 
@@ -45,7 +51,14 @@ def governance_signal(text: str) -> int:
 def parse_story(story: RawStory) -> ParsedStory:
     """Parse a user story into comparable facets."""
 
-    match = STORY_PATTERN.search(story.text)
+    match = None
+    need_match = None
+    for candidate in STORY_PATTERN.finditer(story.text):
+        if candidate["persona"] is not None:
+            match = candidate
+            break
+        if need_match is None:
+            need_match = candidate
 
     persona = "Stakeholder"
     capability = story.text.strip()
@@ -59,15 +72,14 @@ def parse_story(story: RawStory) -> ParsedStory:
             match.group("outcome").strip() if match.group("outcome") else capability
         )
         business_value = functional_outcome
-    elif "i need" in story.text.lower():
-        need_match = re.search(r"i need to ([^.,]+)", story.text, flags=re.IGNORECASE)
-        if need_match:
-            capability = need_match.group(1).strip()
-            functional_outcome = capability
-            business_value = capability
+    elif need_match:
+        capability = need_match.group("need").strip()
+        functional_outcome = capability
+        business_value = capability
 
     domain_terms = iter_domain_terms(keyphrase_candidates(f"{capability} {functional_outcome}"))
-    governance = governance_signal(story.text)
+    lowered = story.text.lower()
+    governance = governance_signal(story.text, lowered)
 
     return ParsedStory(
         story_id=story.story_id,
@@ -79,10 +91,22 @@ def parse_story(story: RawStory) -> ParsedStory:
         domain_terms=domain_terms,
         governance_signal=governance,
         metadata=story.metadata,
+        persona_tokens=role_tokens(persona),
+        capability_terms=keyword_set(capability),
+        value_terms=keyword_set(business_value),
+        raw_terms=keyword_set(story.text),
+        raw_text_lower=lowered,
+        domain_terms_set=frozenset(domain_terms),
     )
 
 
-def parse_stories(stories: List[RawStory]) -> List[ParsedStory]:
-    """Parse each story in a list."""
+PARALLEL_THRESHOLD = 512
+
+
+def parse_stories(stories: List[RawStory], workers: int | None = None) -> List[ParsedStory]:
+    """Parse each story in a list, forking workers for large batches."""
 
+    if workers != 1 and len(stories) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(parse_story, stories, chunksize=64))
     return [parse_story(story) for story in stories]
@@ -5,9 +5,9 @@ from __future__ import annotations
 import math
 import re
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Set
+from typing import Dict, Iterable, List, Sequence, Set
 
-STOPWORDS: Set[str] = {
+STOPWORDS: frozenset = frozenset({
     "a",
     "an",
     "the",
@@ -49,25 +49,44 @@ STOPWORDS: Set[str] = {
     "has",
     "have",
     "had",
-}
+})
 
 
 TOKEN_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9\-']+")
 
+WHITESPACE_RE = re.compile(r"\s+")
+SENTENCE_BREAK_RE = re.compile(r"[.!?]+")
+PERSONA_RE = re.compile(r"as an? ([^,]+)", re.IGNORECASE)
+ROLE_RE = re.compile(r"for ([A-Za-z ]+?) users", re.IGNORECASE)
+OUTCOME_RE = re.compile(r"to ([^.,;]+)", re.IGNORECASE)
+SO_THAT_RE = re.compile(r"so that ([^.,;]+)", re.IGNORECASE)
+BECAUSE_RE = re.compile(r"because(?: of)? ([^.,;]+)", re.IGNORECASE)
+DUE_TO_RE = re.compile(r"due to ([^.,;]+)", re.IGNORECASE)
+VALUE_INTENT_RE = re.compile(
+    r"so that (?P<so>[^.,;]+)|in order to (?=(?P<order>[^.,;]+))",
+    re.IGNORECASE,
+)
+
 
 def normalise_text(text: str) -> str:
     """Return a lowercased, whitespace-collapsed version of ``text``."""
 
-    return re.sub(r"\s+", " ", text.strip().lower())
+    return WHITESPACE_RE.sub(" ", text.strip().lower())
 
 
 def split_sentences(text: str) -> List[str]:
     """Simple sentence splitter used for heuristics."""
 
-    fragments = re.split(r"[.!?]+", text)
+    fragments = SENTENCE_BREAK_RE.split(text)
     return [fragment.strip() for fragment in fragments if fragment.strip()]
 
 
+def role_tokens(role: str) -> Set[str]:
+    """Return the significant tokens of a persona/role string."""
+
+    return {token for token in normalise_text(role).split() if token}
+
+
 def keyword_set(text: str) -> Set[str]:
     """Return a keyword set excluding stopwords."""
 
@@ -77,10 +96,10 @@ def keyword_set(text: str) -> Set[str]:
 def keyphrase_candidates(text: str, min_len: int = 3, max_terms: int = 7) -> List[str]:
     """Extract simple keyphrases by filtering tokens and preserving order."""
 
-    tokens = [token.lower() for token in TOKEN_PATTERN.findall(text)]
     filtered: List[str] = []
-    for token in tokens:
-        if token in STOPWORDS or len(token) < min_len:
+    for match in TOKEN_PATTERN.finditer(text):
+        token = match.group().lower()
+        if len(token) < min_len or token in STOPWORDS:
             continue
         filtered.append(token)
         if len(filtered) == max_terms:
@@ -88,6 +107,45 @@ def keyphrase_candidates(text: str, min_len: int = 3, max_terms: int = 7) -> Lis
     return filtered
 
 
+class Vocabulary:
+    """Interns tokens to bit positions so token sets become int bitsets."""
+
+    __slots__ = ("_ids",)
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+
+    def bitset(self, tokens: Iterable[str]) -> int:
+        """Return an int bitset with one bit per distinct token."""
+
+        ids = self._ids
+        bits = 0
+        for token in tokens:
+            index = ids.get(token)
+            if index is None:
+                index = ids[token] = len(ids)
+            bits |= 1 << index
+        return bits
+
+
+def jaccard_bits(a: int, b: int) -> float:
+    """Jaccard similarity over two interned bitsets."""
+
+    if not a and not b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return (a & b).bit_count() / (a | b).bit_count()
+
+
+def cosine_bits(a: int, b: int) -> float:
+    """Binary cosine overlap over two interned bitsets."""
+
+    if not a or not b:
+        return 0.0
+    return (a & b).bit_count() / math.sqrt(a.bit_count() * b.bit_count())
+
+
 def jaccard_similarity(a: Sequence[str], b: Sequence[str]) -> float:
     """Compute Jaccard similarity between two token sequences."""
 
@@ -125,10 +183,10 @@ def infer_persona(text: str, stakeholder: str | None = None) -> str:
 
     if stakeholder:
         return stakeholder.strip()
-    persona_match = re.search(r"as an? ([^,]+)", text, flags=re.IGNORECASE)
+    persona_match = PERSONA_RE.search(text)
     if persona_match:
         return persona_match.group(1).strip()
-    role_match = re.search(r"for ([A-Za-z ]+?) users", text, flags=re.IGNORECASE)
+    role_match = ROLE_RE.search(text)
     if role_match:
         return role_match.group(1).strip().title()
     return "Stakeholder"
@@ -140,19 +198,19 @@ def extract_outcome_and_barrier(text: str) -> PhraseExtraction:
     outcome = "desired outcome"
     barrier = "an unspecified barrier"
 
-    outcome_match = re.search(r"to ([^.,;]+)", text, flags=re.IGNORECASE)
+    outcome_match = OUTCOME_RE.search(text)
     if outcome_match:
         outcome = outcome_match.group(1).strip()
 
-    so_that_match = re.search(r"so that ([^.,;]+)", text, flags=re.IGNORECASE)
+    so_that_match = SO_THAT_RE.search(text)
     if so_that_match:
         outcome = so_that_match.group(1).strip()
 
-    barrier_match = re.search(r"because(?: of)? ([^.,;]+)", text, flags=re.IGNORECASE)
+    barrier_match = BECAUSE_RE.search(text)
     if barrier_match:
         barrier = barrier_match.group(1).strip()
     else:
-        due_to_match = re.search(r"due to ([^.,;]+)", text, flags=re.IGNORECASE)
+        due_to_match = DUE_TO_RE.search(text)
         if due_to_match:
             barrier = due_to_match.group(1).strip()
 
@@ -162,12 +220,15 @@ def extract_outcome_and_barrier(text: str) -> PhraseExtraction:
 def infer_value_intent(text: str) -> str:
     """Extract a value/intent clause from the text."""
 
-    match = re.search(r"so that ([^.,;]+)", text, flags=re.IGNORECASE)
-    if match:
-        return match.group(1).strip()
-    match = re.search(r"in order to ([^.,;]+)", text, flags=re.IGNORECASE)
-    if match:
-        return match.group(1).strip()
+    order_clause = None
+    for match in VALUE_INTENT_RE.finditer(text):
+        clause = match["so"]
+        if clause is not None:
+            return clause.strip()
+        if order_clause is None:
+            order_clause = match["order"]
+    if order_clause is not None:
+        return order_clause.strip()
     sentences = split_sentences(text)
     if sentences:
         return sentences[-1]